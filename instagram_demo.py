@@ -12,14 +12,15 @@ actionable insights for a social‑media team.
 
 How to run
 ----------
-Run the script with a Python interpreter (Python 3.7+):
+Run the script with a Python interpreter (Python 3.7+) that has pandas
+and pyarrow installed:
 
     python instagram_demo.py
 
 The output will include:
   * A table of the original posts with calculated engagement rates.
   * A list of the top posts sorted by engagement rate.
-  * A ranked list of hashtags by frequency.
+  * A ranked list of the most frequently used hashtags.
   * Average engagement rates by posting hour (helps identify optimal
     posting times).
   * QC recommendations for each caption, highlighting areas such as
@@ -33,10 +34,71 @@ Timestamp) to analyze real data.
 
 """
 
+import numpy as np
 import pandas as pd
 import re
-from collections import Counter
-import itertools
+import sys
+
+# Patterns used by qc_check, compiled once at import time. They rely on
+# Python's Unicode-aware \w and \b, so they must only be applied to
+# object-dtype text: pandas hands patterns for Arrow strings to RE2, whose
+# \w and \b match ASCII only
+# Removes hashtags and strips emojis/special chars in a single pass
+_CLEAN_RE = re.compile(r"#\w+|[^\w\s.!?]")
+_WORD_RE = re.compile(r"\b\w+\b")
+# Words are maximal runs of (Unicode) word characters, so under Python's re
+# these sum to total word length
+_WORD_CHAR_RE = re.compile(r"\w")
+# A sentence is any run between terminators that contains a word character
+_SENT_RE = re.compile(r"\w[^.!?]*")
+
+# QC suggestions, indexed by their bit in the flags from _suggestion_flags
+_SUGGESTION_MESSAGES = (
+    "Consider shortening the caption to keep it concise.",
+    "Break long sentences into shorter ones for better readability.",
+    "Limit hashtags to 3–5 as recommended by Instagram guidelines.",
+    "Consider using trending or niche‑specific hashtags to increase reach.",
+    "Add a few relevant hashtags to improve discoverability.",
+)
+# Joined suggestion text for every possible combination of flags
+_SUGGESTIONS = np.array([
+    "; ".join(msg for bit, msg in enumerate(_SUGGESTION_MESSAGES) if flags & (1 << bit)) or "None"
+    for flags in range(1 << len(_SUGGESTION_MESSAGES))
+], dtype=object)
+
+# Trending/niche hashtags checked by qc_check, lowercased once at import
+TRENDING = frozenset(tag.lower() for tag in (
+    # Art‑related tags (extract from Metricool article)
+    'art', 'artist', 'artwork', 'nailart', 'digitalart', 'arte', 'instaart', 'artistsoninstagram',
+    'streetart', 'artoftheday', 'contemporaryart', 'fanart', 'artofvisuals', 'artsy', 'abstractart',
+    'fineart', 'artgallery', 'instaartist', 'arts', 'myart', 'artistic', 'modernart', 'animeart',
+    'picsart', 'tattooart', 'nailsart', 'artists', 'urbanart', 'artistsofinstagram',
+    # Pet‑related tags
+    'pet', 'pets', 'petstagram', 'petsofinstagram', 'instapet', 'petsagram', 'petlovers',
+    'instapets', 'petshop', 'mypet', 'petphotography', 'petlove', 'cutepets', 'petfriendly',
+    'petscorner', 'petportrait', 'ilovemypet', 'happy_pet', 'petsofinsta', 'picpets', 'lovepets',
+    'nationalpetday', 'worldofcutepets', 'petsmart', 'petsitting', 'petlife', 'petsgram', 'petgrooming',
+    'petofinstagram',
+    # Travel‑related tags
+    'travel', 'travelgram', 'travelphotography', 'instatravel', 'traveling', 'travelling', 'travelblogger',
+    'traveler', 'traveller', 'traveltheworld', 'igtravel', 'travelingram', 'travelblog', 'mytravelgram',
+    'travels', 'instatraveling', 'traveladdict', 'travelphoto', 'traveldiaries', 'travelawesome',
+    'wanderlust', 'wanderlusting', 'wanderluster', 'wanderlusters', 'wanderlustwednesday', 'visualwanderlust',
+    'wanderlustlife', 'asianwanderlust', 'wanderlustvibes', 'travellife',
+))
+
+# Column types applied by read_csv so the CSV is parsed in a single pass.
+# Counts are nullable so rows with an empty count still load
+CSV_DTYPES = {
+    "Post": "string[pyarrow]",
+    "Hashtags": "string[pyarrow]",
+    "Likes": "UInt32",
+    "Comments": "UInt32",
+    "Followers": "UInt32",
+}
+
+# Number of posts and hashtags listed in the report
+TOP_K = 20
 
 
 def load_data(filepath: str) -> pd.DataFrame:
@@ -50,36 +112,54 @@ def load_data(filepath: str) -> pd.DataFrame:
     - Hashtags: comma‑separated list of hashtags (without the `#` symbol).
     - Timestamp: ISO‑8601 datetime string (YYYY‑MM‑DD HH:MM:SS).
 
-    Returns a DataFrame with a parsed Timestamp column.
+    Returns a DataFrame with a parsed Timestamp column, the count
+    columns stored as nullable unsigned 32‑bit integers (missing counts
+    are <NA>; negative counts are rejected), and Hashtags as lists of
+    lowercased tags (Instagram hashtags are case‑insensitive).
     """
-    df = pd.read_csv(filepath)
-    df["Timestamp"] = pd.to_datetime(df["Timestamp"])
-    # Convert comma‑separated hashtags to lists
-    df["Hashtags"] = df["Hashtags"].apply(lambda x: [h.strip() for h in str(x).split(",") if h.strip()])
+    df = pd.read_csv(filepath, dtype=CSV_DTYPES, parse_dates=["Timestamp"])
+    df["Timestamp"] = df["Timestamp"].astype("datetime64[s]")
+    # Convert comma‑separated hashtags to lowercased lists
+    df["Hashtags"] = (
+        df["Hashtags"].fillna("").str.lower().str.split(",")
+        .map(lambda xs: [x.strip() for x in xs if x.strip()])
+    )
     return df
 
 
+def explode_hashtags(df: pd.DataFrame) -> pd.DataFrame:
+    """Flatten the per‑post hashtag lists into a long‑form table.
+
+    Returns a DataFrame with one row per hashtag occurrence and columns
+    'post_idx' (the post's position in `df`) and 'Hashtag'.
+    """
+    tags = df["Hashtags"].reset_index(drop=True).explode().dropna()
+    return pd.DataFrame({
+        "post_idx": tags.index.to_numpy(),
+        "Hashtag": tags.to_numpy(),
+    })
+
+
 def compute_engagement(df: pd.DataFrame) -> pd.DataFrame:
     """Compute engagement rate for each post.
 
     Engagement rate is defined as (Likes + Comments) / Followers.
     Adds a new column 'EngagementRate' to the DataFrame.
     """
-    df = df.copy()
-    df["EngagementRate"] = (df["Likes"] + df["Comments"]) / df["Followers"]
-    return df
+    # Cast every operand so the arithmetic itself runs in float32; mixing
+    # float32 with uint32 would silently promote to float64
+    likes, comments, followers = (df[c].astype("float32") for c in ("Likes", "Comments", "Followers"))
+    return df.assign(EngagementRate=(likes + comments) / followers)
 
 
-def analyze_hashtags(df: pd.DataFrame) -> pd.DataFrame:
+def analyze_hashtags(hashtags: pd.DataFrame) -> pd.DataFrame:
     """Count the frequency of each hashtag across all posts.
 
+    Takes the long‑form table produced by `explode_hashtags`.
     Returns a DataFrame with columns 'Hashtag' and 'Count', sorted
     descending by count.
     """
-    all_tags = list(itertools.chain.from_iterable(df["Hashtags"]))
-    counts = Counter(all_tags)
-    hashtag_df = pd.DataFrame(counts.items(), columns=["Hashtag", "Count"])
-    return hashtag_df.sort_values(by="Count", ascending=False)
+    return hashtags["Hashtag"].value_counts().rename_axis("Hashtag").reset_index(name="Count")
 
 
 def analyze_posting_times(df: pd.DataFrame) -> pd.DataFrame:
@@ -88,13 +168,71 @@ def analyze_posting_times(df: pd.DataFrame) -> pd.DataFrame:
     Extracts the hour from the Timestamp and computes the mean
     engagement rate for each hour.
     """
-    df = df.copy()
-    df["Hour"] = df["Timestamp"].dt.hour
-    hourly = df.groupby("Hour")["EngagementRate"].mean().reset_index()
+    hours = df["Timestamp"].dt.hour
+    has_hour = hours.notna()
+    hours = hours[has_hour].to_numpy(dtype=np.intp)
+    rates = df["EngagementRate"][has_hour].to_numpy(dtype=np.float64)
+    rated = ~np.isnan(rates)
+    # Hours are dense in [0, 24), so bin directly instead of hashing groups
+    posts = np.bincount(hours, minlength=24)
+    sums = np.bincount(hours[rated], weights=rates[rated], minlength=24)
+    counts = np.bincount(hours[rated], minlength=24)
+    # Like groupby().mean(), an hour whose posts all lack a rate shows NaN
+    with np.errstate(invalid="ignore"):
+        means = sums / counts
+    hourly = pd.DataFrame({"Hour": np.arange(24), "EngagementRate": means})[posts > 0]
     return hourly.sort_values(by="EngagementRate", ascending=False)
 
 
-def qc_check(df: pd.DataFrame) -> pd.DataFrame:
+def _suggestion_flags(word_count: np.ndarray, avg_sent_len: np.ndarray,
+                      hashtag_count: np.ndarray, trending_count: np.ndarray) -> np.ndarray:
+    """Evaluate the QC checks for every caption at once.
+
+    Returns a uint8 array where bit i is set when the caption should
+    receive `_SUGGESTION_MESSAGES[i]`.
+    """
+    flags = np.zeros(len(word_count), dtype=np.uint8)
+    # If caption is very long
+    flags |= (word_count > 40).astype(np.uint8)
+    # Long sentences may reduce readability
+    flags |= (avg_sent_len > 20).astype(np.uint8) << 1
+    # Instagram allows up to 30 hashtags but recommends ~3–5【628487384572305†L442-L449】
+    flags |= (hashtag_count > 5).astype(np.uint8) << 2
+    # Encourage using trending/niche tags
+    flags |= (trending_count == 0).astype(np.uint8) << 3
+    # Encourage adding at least a couple of hashtags
+    flags |= (hashtag_count < 2).astype(np.uint8) << 4
+    return flags
+
+
+def _caption_metrics(captions: pd.Index) -> pd.DataFrame:
+    """Measure word and sentence statistics for each caption.
+
+    Hashtags and special characters are stripped before counting.
+    """
+    # Arrow strings would hand these patterns to RE2, whose \w is ASCII-only;
+    # run them through Python's re so non-English captions count correctly
+    text_only = pd.Series(captions, dtype=object).str.replace(_CLEAN_RE, "", regex=True)
+    word_count = text_only.str.count(_WORD_RE)
+    sentence_count = text_only.str.count(_SENT_RE)
+    word_chars = text_only.str.count(_WORD_CHAR_RE)
+    return pd.DataFrame({
+        "word_count": word_count,
+        "sentence_count": sentence_count,
+        "avg_word_length": (word_chars / word_count).where(word_count > 0, 0),
+        "avg_sentence_length": (word_count / sentence_count).where(sentence_count > 0, 0),
+    })
+
+
+def _round2(values: pd.Series) -> pd.Series:
+    """Round to two decimals with the builtin `round`, as the report always has.
+
+    Captions with nothing to average keep a plain 0.
+    """
+    return values.map(lambda v: round(float(v), 2) if v else 0)
+
+
+def qc_check(df: pd.DataFrame, hashtags: pd.DataFrame) -> pd.DataFrame:
     """Run basic content quality checks on each caption.
 
     The checks include:
@@ -106,68 +244,39 @@ def qc_check(df: pd.DataFrame) -> pd.DataFrame:
       long sentences, using trending hashtags, or adjusting the number
       of hashtags).
 
+    `hashtags` is the long‑form table produced by `explode_hashtags(df)`.
     Returns a DataFrame with these metrics and suggestions alongside
     the original caption.
     """
-    trending = {
-        # Art‑related tags (extract from Metricool article)
-        'art', 'artist', 'artwork', 'nailart', 'digitalart', 'arte', 'instaart', 'artistsoninstagram',
-        'streetart', 'artoftheday', 'contemporaryart', 'fanart', 'artofvisuals', 'artsy', 'abstractart',
-        'fineart', 'artgallery', 'instaartist', 'arts', 'myart', 'artistic', 'modernart', 'animeart',
-        'picsart', 'tattooart', 'nailsart', 'artists', 'urbanart', 'artistsofinstagram',
-        # Pet‑related tags
-        'pet', 'pets', 'petstagram', 'petsofinstagram', 'instapet', 'petsagram', 'petlovers',
-        'instapets', 'petshop', 'mypet', 'petphotography', 'petlove', 'cutepets', 'petfriendly',
-        'petscorner', 'petportrait', 'ilovemypet', 'happy_pet', 'petsofinsta', 'picpets', 'lovepets',
-        'nationalpetday', 'worldofcutepets', 'petsmart', 'petsitting', 'petlife', 'petsgram', 'petgrooming',
-        'petofinstagram',
-        # Travel‑related tags
-        'travel', 'travelgram', 'travelphotography', 'instatravel', 'traveling', 'travelling', 'travelblogger',
-        'traveler', 'traveller', 'traveltheworld', 'igtravel', 'travelingram', 'travelblog', 'mytravelgram',
-        'travels', 'instatraveling', 'traveladdict', 'travelphoto', 'traveldiaries', 'travelawesome',
-        'wanderlust', 'wanderlusting', 'wanderluster', 'wanderlusters', 'wanderlustwednesday', 'visualwanderlust',
-        'wanderlustlife', 'asianwanderlust', 'wanderlustvibes', 'travellife'
-    }
-    results = []
-    for _, row in df.iterrows():
-        caption = row["Post"]
-        hashtags = [h.lower() for h in row["Hashtags"]]
-        text_only = re.sub(r"#\w+", "", caption)  # remove hashtags
-        text_only = re.sub(r"[^\w\s\.\!\?]", "", text_only)  # strip emojis/special chars
-        words = re.findall(r"\b\w+\b", text_only)
-        sentences = [s.strip() for s in re.split(r"[\.!?]+", text_only) if s.strip()]
-        word_count = len(words)
-        sentence_count = len(sentences)
-        avg_word_len = sum(len(w) for w in words) / word_count if word_count else 0
-        avg_sent_len = word_count / sentence_count if sentence_count else 0
-        trending_used = [h for h in hashtags if h in trending]
-        suggestions = []
-        # If caption is very long
-        if word_count > 40:
-            suggestions.append("Consider shortening the caption to keep it concise.")
-        # Long sentences may reduce readability
-        if avg_sent_len > 20:
-            suggestions.append("Break long sentences into shorter ones for better readability.")
-        # Instagram allows up to 30 hashtags but recommends ~3–5【628487384572305†L442-L449】
-        if len(hashtags) > 5:
-            suggestions.append("Limit hashtags to 3–5 as recommended by Instagram guidelines.")
-        # Encourage using trending/niche tags
-        if not trending_used:
-            suggestions.append("Consider using trending or niche‑specific hashtags to increase reach.")
-        # Encourage adding at least a couple of hashtags
-        if len(hashtags) < 2:
-            suggestions.append("Add a few relevant hashtags to improve discoverability.")
-        results.append({
-            "Post": caption,
-            "word_count": word_count,
-            "sentence_count": sentence_count,
-            "avg_word_length": round(avg_word_len, 2),
-            "avg_sentence_length": round(avg_sent_len, 2),
-            "hashtag_count": len(hashtags),
-            "trending_hashtags_used": ", ".join(trending_used) if trending_used else "None",
-            "suggestions": "; ".join(suggestions) if suggestions else "None"
-        })
-    return pd.DataFrame(results)
+    posts = df["Post"].fillna("").reset_index(drop=True)
+    # Reposts and template captions repeat often, so measure each distinct
+    # caption once and broadcast the metrics back to every post using it
+    codes, captions = posts.factorize()
+    metrics = _caption_metrics(captions).take(codes).reset_index(drop=True)
+    word_count = metrics["word_count"]
+    sentence_count = metrics["sentence_count"]
+    avg_word_len = metrics["avg_word_length"]
+    avg_sent_len = metrics["avg_sentence_length"]
+    hashtag_count = hashtags.groupby("post_idx").size().reindex(posts.index, fill_value=0)
+    trending = hashtags[hashtags["Hashtag"].isin(TRENDING)].groupby("post_idx")["Hashtag"]
+    trending_count = trending.size().reindex(posts.index, fill_value=0)
+    trending_used = trending.agg(", ".join).reindex(posts.index, fill_value="None")
+    flags = _suggestion_flags(
+        word_count.to_numpy(),
+        avg_sent_len.to_numpy(),
+        hashtag_count.to_numpy(),
+        trending_count.to_numpy(),
+    )
+    return pd.DataFrame({
+        "Post": posts,
+        "word_count": word_count,
+        "sentence_count": sentence_count,
+        "avg_word_length": _round2(avg_word_len),
+        "avg_sentence_length": _round2(avg_sent_len),
+        "hashtag_count": hashtag_count,
+        "trending_hashtags_used": trending_used,
+        "suggestions": _SUGGESTIONS[flags],
+    })
 
 
 def main():
@@ -175,39 +284,50 @@ def main():
     df = load_data("instagram_sample_data.csv")
     # Compute engagement rate
     df_eng = compute_engagement(df)
+    # Flatten hashtags once for every analysis that needs them
+    hashtags = explode_hashtags(df_eng)
     # Identify top posts
-    top_posts = df_eng.sort_values(by="EngagementRate", ascending=False)
-    # Hashtag frequencies
-    hashtag_df = analyze_hashtags(df_eng)
+    top_posts = df_eng.nlargest(TOP_K, "EngagementRate")
+    # Hashtag frequencies (already ranked by count)
+    hashtag_df = analyze_hashtags(hashtags).head(TOP_K)
     # Best posting times
     hourly = analyze_posting_times(df_eng)
     # QC checks
-    qc_df = qc_check(df_eng)
+    qc_df = qc_check(df_eng, hashtags)
 
     print("\nOriginal dataset with engagement rates:\n")
     print(df_eng.to_string(index=False))
 
-    print("\nTop posts by engagement rate (descending):\n")
-    for _, row in top_posts.iterrows():
-        print(f"- EngagementRate: {row['EngagementRate']:.4f} | Post: {row['Post'][:60]}...")
+    # Each section is formatted in full and written with a single call
+    print(f"\nTop {len(top_posts)} posts by engagement rate (descending):\n")
+    sys.stdout.write("".join(
+        f"- EngagementRate: {row.EngagementRate:.4f} | Post: {row.Post[:60]}...\n"
+        for row in top_posts.itertuples(index=False)
+    ))
 
-    print("\nHashtag usage frequency:\n")
-    for _, row in hashtag_df.iterrows():
-        print(f"# {row['Hashtag']}: {row['Count']} times")
+    print(f"\nTop {len(hashtag_df)} hashtags by usage frequency:\n")
+    sys.stdout.write("".join(
+        f"# {row.Hashtag}: {row.Count} times\n"
+        for row in hashtag_df.itertuples(index=False)
+    ))
 
     print("\nAverage engagement rate by posting hour:\n")
-    for _, row in hourly.iterrows():
-        print(f"Hour {int(row['Hour']):02d}: {row['EngagementRate']:.4f}")
+    sys.stdout.write("".join(
+        f"Hour {int(row.Hour):02d}: {row.EngagementRate:.4f}\n"
+        for row in hourly.itertuples(index=False)
+    ))
 
     print("\nContent quality checks and suggestions:\n")
-    for _, row in qc_df.iterrows():
-        print(f"Post: {row['Post'][:60]}...")
-        print(f"  Words: {row['word_count']}, Sentences: {row['sentence_count']}, "
-              f"Avg word length: {row['avg_word_length']}, "
-              f"Avg sentence length: {row['avg_sentence_length']}")
-        print(f"  Hashtags used: {row['hashtag_count']}, Trending used: {row['trending_hashtags_used']}")
-        print(f"  Suggestions: {row['suggestions']}")
-        print("")
+    sys.stdout.write("".join(
+        f"Post: {row.Post[:60]}...\n"
+        f"  Words: {row.word_count}, Sentences: {row.sentence_count}, "
+        f"Avg word length: {row.avg_word_length}, "
+        f"Avg sentence length: {row.avg_sentence_length}\n"
+        f"  Hashtags used: {row.hashtag_count}, Trending used: {row.trending_hashtags_used}\n"
+        f"  Suggestions: {row.suggestions}\n"
+        "\n"
+        for row in qc_df.itertuples(index=False)
+    ))
 
 
 if __name__ == "__main__":